@@ -7,6 +7,7 @@ Simple command-line interface for extracting text and coordinates from PDFs
 import argparse
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from modules.pdf_parser import PDFParser
 from modules.text_processor import TextProcessor
 from modules.data_exporter import DataExporter
@@ -43,6 +44,8 @@ Examples:
                        help='Export as JSON with full coordinate data')
     parser.add_argument('--csv', action='store_true',
                        help='Export as CSV for analysis')
+    parser.add_argument('--parquet', action='store_true',
+                       help='Export as Parquet for fast ML loading')
     parser.add_argument('--features', action='store_true',
                        help='Export feature vectors for ML')
     parser.add_argument('--text', action='store_true',
@@ -77,13 +80,14 @@ Examples:
         args.output_name = os.path.splitext(os.path.basename(args.pdf_file))[0]
     
     # If no format specified, default to JSON
-    if not any([args.json, args.csv, args.features, args.text, args.all]):
+    if not any([args.json, args.csv, args.parquet, args.features, args.text, args.all]):
         args.json = True
-        
+
     # If --all specified, enable all formats
     if args.all:
         args.json = True
         args.csv = True
+        args.parquet = True
         args.features = True
         args.text = True
     
@@ -96,9 +100,7 @@ Examples:
     pdf_parser = PDFParser(use_ocr=args.ocr)
     text_processor = TextProcessor()
     exporter = DataExporter(output_dir=args.output_dir, source_file=args.pdf_file)
-    
-    print(f"Specific output directory: {exporter.output_dir}\n")
-    
+
     # Extract text with coordinates
     print("Extracting text with coordinates...")
     elements = pdf_parser.extract_text_with_coordinates(args.pdf_file)
@@ -117,69 +119,83 @@ Examples:
         print(f"Output directory: {exporter.output_dir}")
         sys.exit(1)
         
-    # Copy original file after successful extraction
+    # Copy original file after successful extraction; this is also
+    # what computes the file hash, so the output directory is only
+    # known (and printed) from here on
     copied_path = exporter.copy_original_file()
     if copied_path:
         print(f"Original file copied to: {copied_path}")
-        
+
+    print(f"Specific output directory: {exporter.output_dir}\n")
     print(f"Extracted {len(elements)} text elements")
     
-    # Get page dimensions for normalization
-    page_dims = pdf_parser.get_page_dimensions(args.pdf_file)
+    # Page dimensions were captured during extraction; only re-open the
+    # PDF if that pass didn't record them
+    page_dims = pdf_parser.last_page_dims
+    if not page_dims:
+        page_dims = pdf_parser.get_page_dimensions(args.pdf_file)
     
     # Normalize if requested
     if args.normalize:
         print("Normalizing coordinates...")
         elements = pdf_parser.normalize_coordinates(elements, page_dims)
     
-    # Export in requested formats
-    output_files = []
-    
+    # Export in requested formats - the exports are independent and
+    # largely I/O bound, so run them concurrently
+    export_jobs = []
+
     if args.json:
-        print("\nExporting JSON...")
         metadata = {
             "source_file": args.pdf_file,
             "ocr_used": args.ocr,
             "normalized": args.normalize,
             "page_count": len(page_dims)
         }
-        json_path = exporter.export_to_json(elements, metadata, args.output_name)
-        output_files.append(json_path)
-        
+        export_jobs.append(
+            ("JSON",
+             lambda: [exporter.export_to_json(elements, metadata, args.output_name)]))
+
     if args.csv:
-        print("\nExporting CSV...")
-        csv_path = exporter.export_to_csv(elements, args.output_name)
-        output_files.append(csv_path)
-        
+        export_jobs.append(
+            ("CSV",
+             lambda: [exporter.export_to_csv(elements, args.output_name)]))
+
+    if args.parquet:
+        export_jobs.append(
+            ("Parquet",
+             lambda: [exporter.export_to_parquet(elements, args.output_name)]))
+
     if args.features:
-        print("\nExporting feature vectors...")
-        feature_paths = exporter.export_feature_vectors(
-            elements, page_dims, args.output_name
-        )
-        output_files.extend(feature_paths.values())
-        
-        # Also export clustering-ready data
-        cluster_path = exporter.export_for_clustering(
-            elements, normalize=True, output_name=f"{args.output_name}_clustering"
-        )
-        output_files.append(cluster_path)
-        
-    if args.text:
-        print(f"\nExporting text (grouped by {args.group})...")
-        text_path = exporter.export_text_only(
-            elements, group_by=args.group, output_name=args.output_name
-        )
-        output_files.append(text_path)
-    
-    # Create visualization data
-    print("\nCreating visualization data...")
-    viz_path = exporter.create_visualization_data(elements, f"{args.output_name}_viz")
-    output_files.append(viz_path)
-    
-    # Always create text with coordinates file (required by CLAUDE.md)
-    print("\nCreating text with coordinates file...")
-    coords_path = exporter.export_text_with_coordinates(elements, f"{args.output_name}_coordinates")
-    output_files.append(coords_path)
+        def export_features():
+            paths = list(exporter.export_feature_vectors(
+                elements, page_dims, args.output_name
+            ).values())
+            # Also export clustering-ready data
+            paths.append(exporter.export_for_clustering(
+                elements, normalize=True,
+                output_name=f"{args.output_name}_clustering"
+            ))
+            return paths
+        export_jobs.append(("feature vectors", export_features))
+
+    # Visualization and coordinates files are always created (the
+    # latter is required by CLAUDE.md); together with the optional text
+    # export they share one fused pass over the elements
+    export_jobs.append(
+        ("visualization, coordinates" + (" and text" if args.text else ""),
+         lambda: list(exporter.export_combined(
+             elements,
+             viz_name=f"{args.output_name}_viz",
+             coords_name=f"{args.output_name}_coordinates",
+             text_name=args.output_name if args.text else None,
+             group_by=args.group).values())))
+
+    output_files = []
+    with ThreadPoolExecutor(max_workers=len(export_jobs)) as executor:
+        futures = [(name, executor.submit(job)) for name, job in export_jobs]
+        for name, future in futures:
+            print(f"\nExporting {name}...")
+            output_files.extend(future.result())
     
     # Summary
     print("\n" + "="*50)
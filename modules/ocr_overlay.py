@@ -7,14 +7,20 @@ Addresses corruption issues in file handling and overlay generation
 
 import os
 import sys
+import functools
 import hashlib
+import mmap
 import shutil
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 import pytesseract
 import argparse
 import json
-from typing import List, Dict, Tuple, Optional
+from typing import Any, List, Dict, Tuple, Optional
 
 try:
     from reportlab.pdfgen import canvas
@@ -25,10 +31,75 @@ except ImportError:
     PDF_AVAILABLE = False
     print("Warning: reportlab not available, PDF generation disabled")
 
+# Optional in-process Tesseract API - avoids spawning a subprocess and
+# reloading language data for every image
+try:
+    from tesserocr import PyTessBaseAPI, RIL, iterate_level
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+# Optional BLAKE3 - SIMD/tree-parallel and several times faster than
+# SHA-256; the hash here only names output directories, so the faster
+# non-SHA digest is fine. Falls back to sha256
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# Optional fast JSON serializer - falls back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional msgpack for the on-disk OCR cache - compact binary encode/
+# decode; the cache falls back to JSON when it is not installed
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 
 class OCROverlayFixed:
     """Fixed OCR text overlay processor"""
-    
+
+    _SYSTEM_FONT_PATHS = (
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "/usr/share/fonts/TTF/DejaVuSans.ttf",
+        "/System/Library/Fonts/Arial.ttf",
+        "C:\\Windows\\Fonts\\arial.ttf"
+    )
+    # Loaded fonts shared across instances, keyed by (path, size) -
+    # avoids re-probing the filesystem and re-parsing TTF tables for
+    # every processor constructed
+    _FONT_CACHE: Dict[Tuple[Optional[str], int], Any] = {}
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _resolved_system_font() -> Optional[str]:
+        """First existing system font path, probed once per process"""
+        return next((p for p in OCROverlayFixed._SYSTEM_FONT_PATHS
+                     if os.path.exists(p)), None)
+
+    @classmethod
+    def _get_font(cls, font_path: Optional[str], font_size: int):
+        """Load (or reuse) the overlay font for a path/size pair"""
+        key = (font_path, font_size)
+        font = cls._FONT_CACHE.get(key)
+        if font is None:
+            try:
+                if font_path and os.path.exists(font_path):
+                    font = ImageFont.truetype(font_path, font_size)
+                else:
+                    resolved = cls._resolved_system_font()
+                    font = (ImageFont.truetype(resolved, font_size)
+                            if resolved else ImageFont.load_default())
+            except Exception:
+                font = ImageFont.load_default()
+            cls._FONT_CACHE[key] = font
+        return font
+
     def __init__(self, 
                  tesseract_cmd: Optional[str] = None,
                  font_path: Optional[str] = None,
@@ -49,40 +120,217 @@ class OCROverlayFixed:
         self.font_size = font_size
         self.font_path = font_path
         self.output_base_dir = Path(output_base_dir)
-        
-        # Try to load a font
+
+        # Cached font load - shared across instances
+        self.font = self._get_font(font_path, font_size)
+
+        # Scratch 1x1 surface for measuring text plus a size cache -
+        # OCR output repeats short strings (digits, common words)
+        # heavily, so each unique string is rasterize-measured once
+        self._measure_draw = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+        self._text_size_cache = {}
+
+        # Persistent in-process Tesseract APIs, one per worker thread -
+        # API instances are not thread-safe, but recognition releases
+        # the GIL so separate instances run genuinely in parallel
+        self._tess_local = threading.local()
+        self._tess_apis = []
+        self._tess_lock = threading.Lock()
+
+        # Scratch overlay images reused across calls, keyed by
+        # (mode, size) - a full-page RGB buffer is tens of MB at scan
+        # resolution, so reusing one avoids allocator/GC churn on
+        # large batches
+        self._img_pool = defaultdict(list)
+        self._img_pool_lock = threading.Lock()
+
+    @property
+    def api(self):
+        """Per-thread in-process Tesseract API (None if unavailable)"""
+        if not TESSEROCR_AVAILABLE:
+            return None
+        api = getattr(self._tess_local, 'api', None)
+        if api is None:
+            try:
+                api = PyTessBaseAPI(psm=6)
+                api.SetVariable('preserve_interword_spaces', '1')
+                with self._tess_lock:
+                    self._tess_apis.append(api)
+            except Exception as e:
+                print(f"Warning: tesserocr init failed, using pytesseract: {e}")
+                api = False  # Cache the failure so we don't retry per call
+            self._tess_local.api = api
+        return api or None
+
+    def close(self):
+        """Release any persistent Tesseract API instances"""
+        with self._tess_lock:
+            for api in self._tess_apis:
+                api.End()
+            self._tess_apis = []
+        self._tess_local = threading.local()
+
+    def __del__(self):
         try:
-            if font_path and os.path.exists(font_path):
-                self.font = ImageFont.truetype(font_path, font_size)
-            else:
-                # Try common system fonts
-                for font_name in [
-                    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-                    "/usr/share/fonts/TTF/DejaVuSans.ttf",
-                    "/System/Library/Fonts/Arial.ttf",
-                    "C:\\Windows\\Fonts\\arial.ttf"
-                ]:
-                    if os.path.exists(font_name):
-                        self.font = ImageFont.truetype(font_name, font_size)
-                        break
-                else:
-                    # Fall back to default font
-                    self.font = ImageFont.load_default()
+            self.close()
         except Exception:
-            self.font = ImageFont.load_default()
-    
-    def extract_text_with_positions(self, image_path: str) -> List[Dict]:
+            pass
+
+    def _acquire_image(self, size: Tuple[int, int],
+                       mode: str = 'RGB') -> Image.Image:
+        """Take a scratch image from the pool, allocating if empty"""
+        with self._img_pool_lock:
+            pool = self._img_pool[(mode, size)]
+            if pool:
+                return pool.pop()
+        return Image.new(mode, size)
+
+    def _release_image(self, img: Image.Image) -> None:
+        """Return a scratch image to the pool for reuse"""
+        with self._img_pool_lock:
+            self._img_pool[(img.mode, img.size)].append(img)
+
+    def _ocr_cache_path(self, file_hash: str) -> Path:
+        """Cache file path for a given image content hash"""
+        ext = '.msgpack' if msgpack is not None else '.json'
+        return self.output_base_dir / '.ocr_cache' / f"{file_hash}{ext}"
+
+    def _load_cached_blocks(self, cache_path: Path) -> Optional[List[Dict]]:
+        """Load cached OCR text blocks (None on miss or corruption)"""
+        try:
+            if not cache_path.exists():
+                return None
+            data = cache_path.read_bytes()
+            if msgpack is not None:
+                return msgpack.unpackb(data)
+            return json.loads(data)
+        except Exception as e:
+            print(f"Warning: ignoring unreadable OCR cache: {e}")
+            return None
+
+    def _store_cached_blocks(self, cache_path: Path,
+                             text_blocks: List[Dict]) -> None:
+        """Persist OCR text blocks for reuse on identical input bytes"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            if msgpack is not None:
+                cache_path.write_bytes(msgpack.packb(text_blocks))
+            elif orjson is not None:
+                cache_path.write_bytes(orjson.dumps(text_blocks))
+            else:
+                cache_path.write_text(json.dumps(text_blocks),
+                                      encoding='utf-8')
+        except Exception as e:
+            print(f"Warning: failed to write OCR cache: {e}")
+
+    @staticmethod
+    def _otsu_threshold(arr: np.ndarray) -> int:
+        """Otsu's threshold over a 256-bin grayscale histogram"""
+        hist = np.bincount(arr.ravel(), minlength=256).astype(np.float64)
+        weights = np.cumsum(hist)
+        means = np.cumsum(hist * np.arange(256))
+        w0 = weights[:-1]
+        w1 = arr.size - w0
+        m0 = means[:-1] / np.where(w0 > 0, w0, 1)
+        m1 = (means[-1] - means[:-1]) / np.where(w1 > 0, w1, 1)
+        between = w0 * w1 * (m0 - m1) ** 2
+        between[(w0 == 0) | (w1 == 0)] = 0
+        return int(np.argmax(between))
+
+    # Longest image side fed to recognition; LSTM cost grows with
+    # pixel count while accuracy plateaus well below this on scans
+    _MAX_OCR_SIDE = 1600
+
+    def _preprocess_for_ocr(self, image: Image.Image) -> Tuple[Image.Image, float]:
+        """
+        Downscale and binarize oversized inputs before recognition
+
+        Tesseract's LSTM cost grows with pixel count while accuracy
+        plateaus around 300 DPI, so scans above that are resampled to
+        a 300 DPI equivalent; independent of DPI metadata, the longest
+        side is also capped at _MAX_OCR_SIDE. Downscaled images are
+        Otsu-thresholded. The original stays untouched for overlay
+        rendering - only the recognition input shrinks.
+
+        Returns:
+            (preprocessed image, scale factor mapping its coordinates
+            back to the original resolution)
+        """
+        scale = 1.0
+        dpi = image.info.get('dpi')
+        try:
+            dpi = float(dpi[0]) if dpi else 0.0
+        except (TypeError, ValueError, IndexError):
+            dpi = 0.0
+
+        if dpi > 300:
+            scale = dpi / 300.0
+
+        # Many scans carry no DPI metadata at all - cap the longest
+        # side too, whichever rule shrinks more wins
+        longest = max(image.width, image.height)
+        if longest / scale > self._MAX_OCR_SIDE:
+            scale = longest / self._MAX_OCR_SIDE
+
+        if scale > 1.0:
+            new_size = (max(1, int(image.width / scale)),
+                        max(1, int(image.height / scale)))
+            print(f"Downscaling {image.size} image for OCR: {new_size}")
+            image = image.resize(new_size, Image.LANCZOS)
+
+        # Binarize every input, not just downscaled ones - Tesseract
+        # thresholds internally anyway, and handing it a clean Otsu
+        # binary image skips that work while the numpy threshold pass
+        # costs almost nothing
+        gray = np.asarray(image.convert('L'))
+        threshold = self._otsu_threshold(gray)
+        image = Image.fromarray(
+            (gray > threshold).astype(np.uint8) * 255, 'L')
+
+        return image, scale
+
+    @staticmethod
+    def _rescale_blocks(text_blocks: List[Dict], scale: float) -> List[Dict]:
+        """Map OCR block coordinates back to the original resolution"""
+        if scale != 1.0:
+            for block in text_blocks:
+                block['x'] = int(block['x'] * scale)
+                block['y'] = int(block['y'] * scale)
+                block['width'] = int(block['width'] * scale)
+                block['height'] = int(block['height'] * scale)
+        return text_blocks
+
+    def extract_text_with_positions(self, image_path: str,
+                                    file_hash: Optional[str] = None) -> Tuple[List[Dict], str]:
         """
         Extract text from image with bounding box positions
+
+        When the caller already knows the image's content hash, it is
+        used as a key into an on-disk cache so reprocessing identical
+        bytes (e.g. trying another overlay style) skips the Tesseract
+        recognition pass entirely.
+
+        Returns:
+            Tuple of (text blocks, newline-joined plain text) - the
+            plain text is assembled during the accept pass so callers
+            don't rescan the block list to rebuild it
         """
         try:
             print(f"Extracting text from: {image_path}")
-            
-            # Verify image exists and is readable
-            if not os.path.exists(image_path):
-                print(f"Error: Image file not found: {image_path}")
-                return []
-            
+
+            # No exists() pre-check here - Image.open below reports a
+            # missing file through the same error path, saving a stat
+
+            # Content-addressed cache lookup - OCR dominates pipeline
+            # cost, so a hit makes repeat runs near-instantaneous
+            cache_path = None
+            if file_hash:
+                cache_path = self._ocr_cache_path(file_hash)
+                cached = self._load_cached_blocks(cache_path)
+                if cached is not None:
+                    print(f"OCR cache hit: {len(cached)} text blocks")
+                    return cached, "\n".join(b['text'] for b in cached)
+
             # Open and verify image
             try:
                 with Image.open(image_path) as image:
@@ -92,69 +340,205 @@ class OCROverlayFixed:
                     if image.mode not in ('RGB', 'L'):
                         image = image.convert('RGB')
                         print(f"Converted image to RGB mode")
-                    
+
+                    # High-DPI scans are downscaled and binarized before
+                    # recognition; coord_scale maps the resulting block
+                    # coordinates back to the original resolution
+                    image, coord_scale = self._preprocess_for_ocr(image)
+
                     # Get detailed OCR data with positions
                     print("Running OCR extraction...")
+                    if self.api is not None:
+                        text_blocks, all_text = self._extract_with_tesserocr(image)
+                        text_blocks = self._rescale_blocks(text_blocks,
+                                                           coord_scale)
+                        print(f"Found {len(text_blocks)} valid text blocks")
+                        for i, block in enumerate(text_blocks[:5]):
+                            print(f"  Block {i+1}: '{block['text']}' (conf: {block['confidence']}%)")
+                        if cache_path is not None and text_blocks:
+                            self._store_cached_blocks(cache_path, text_blocks)
+                        return text_blocks, all_text
+
                     ocr_data = pytesseract.image_to_data(
-                        image, 
+                        image,
                         output_type=pytesseract.Output.DICT,
                         config='--psm 6 -c preserve_interword_spaces=1'
                     )
-                    
+
             except Exception as e:
                 print(f"Error opening image: {e}")
-                return []
-            
-            text_blocks = []
-            
-            # Process OCR results with better filtering
+                return [], ""
+
+            # Process OCR results with better filtering - one vectorized
+            # mask over the parallel arrays, then dicts only for the
+            # surviving rows (most OCR rows are empty parent boxes)
             print(f"Processing {len(ocr_data['text'])} OCR elements...")
-            
-            for i in range(len(ocr_data['text'])):
-                text = ocr_data['text'][i].strip()
-                confidence = int(ocr_data['conf'][i]) if ocr_data['conf'][i] != '-1' else 0
-                
-                # More lenient filtering - accept lower confidence for debugging
-                if text and confidence > 0:  # Reduced from 30 to 0 for debugging
-                    text_blocks.append({
-                        'text': text,
-                        'x': ocr_data['left'][i],
-                        'y': ocr_data['top'][i],
-                        'width': ocr_data['width'][i],
-                        'height': ocr_data['height'][i],
-                        'confidence': confidence
-                    })
-            
+
+            texts = np.asarray([t.strip() for t in ocr_data['text']])
+            confs = np.asarray(ocr_data['conf'], dtype=np.int32)
+
+            # More lenient filtering - accept lower confidence for
+            # debugging (reduced from 30 to 0)
+            mask = (confs > 0) & (texts != '')
+            idx = np.flatnonzero(mask)
+            kept = texts[idx]
+
+            text_blocks = [
+                {
+                    'text': str(kept[j]),
+                    'x': ocr_data['left'][i],
+                    'y': ocr_data['top'][i],
+                    'width': ocr_data['width'][i],
+                    'height': ocr_data['height'][i],
+                    'confidence': int(confs[i])
+                }
+                for j, i in enumerate(idx)
+            ]
+            text_blocks = self._rescale_blocks(text_blocks, coord_scale)
+
+
             print(f"Found {len(text_blocks)} valid text blocks")
             for i, block in enumerate(text_blocks[:5]):  # Show first 5 for debugging
                 print(f"  Block {i+1}: '{block['text']}' (conf: {block['confidence']}%)")
-            
-            return text_blocks
-            
+
+            if cache_path is not None and text_blocks:
+                self._store_cached_blocks(cache_path, text_blocks)
+
+            return text_blocks, "\n".join(kept)
+
         except Exception as e:
             print(f"Error extracting text: {e}")
             import traceback
             traceback.print_exc()
-            return []
+            return [], ""
     
+    def _text_size(self, text: str) -> Tuple[int, int]:
+        """Measure rendered text size, cached per unique string"""
+        cached = self._text_size_cache.get(text)
+        if cached is None:
+            try:
+                bbox = self._measure_draw.textbbox((0, 0), text,
+                                                   font=self.font)
+                cached = (bbox[2] - bbox[0], bbox[3] - bbox[1])
+            except Exception:
+                # Fallback if textbbox not available
+                cached = (int(len(text) * self.font_size * 0.6),
+                          self.font_size)
+            if len(self._text_size_cache) < 4096:
+                self._text_size_cache[text] = cached
+        return cached
+
+    def _extract_with_tesserocr(self, image: Image.Image) -> Tuple[List[Dict], str]:
+        """
+        Run OCR through the persistent in-process Tesseract API
+
+        Produces the same text-block dicts as the pytesseract path
+        without a subprocess or TSV parse per image, plus the joined
+        plain text accumulated during the same accept pass.
+        """
+        api = self.api
+        # Hand the engine a contiguous grayscale buffer directly:
+        # SetImageBytes avoids the PIL-to-Leptonica conversion SetImage
+        # performs, and grayscale halves the bytes moved into Tesseract
+        # (which works on luminance anyway)
+        if image.mode != 'L':
+            image = image.convert('L')
+        arr = np.ascontiguousarray(np.asarray(image, dtype=np.uint8))
+        api.SetImageBytes(arr.tobytes(), arr.shape[1], arr.shape[0],
+                          1, arr.shape[1])
+        api.Recognize()
+
+        text_blocks = []
+        text_parts = []
+        iterator = api.GetIterator()
+        if iterator is None:
+            return text_blocks, ""
+
+        for word in iterate_level(iterator, RIL.WORD):
+            try:
+                text = word.GetUTF8Text(RIL.WORD).strip()
+                confidence = int(word.Confidence(RIL.WORD))
+            except RuntimeError:
+                continue
+
+            # Same lenient filtering as the pytesseract path
+            if text and confidence > 0:
+                x0, y0, x1, y1 = word.BoundingBox(RIL.WORD)
+                text_blocks.append({
+                    'text': text,
+                    'x': x0,
+                    'y': y0,
+                    'width': x1 - x0,
+                    'height': y1 - y0,
+                    'confidence': confidence
+                })
+                text_parts.append(text)
+
+        return text_blocks, "\n".join(text_parts)
+
     def calculate_file_hash(self, file_path: str) -> str:
-        """Calculate SHA256 hash of a file"""
+        """Calculate content hash of a file (BLAKE3, or SHA256 fallback)"""
         try:
-            hash_sha256 = hashlib.sha256()
+            hasher = blake3.blake3() if blake3 is not None else hashlib.sha256()
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_sha256.update(chunk)
-            return hash_sha256.hexdigest()
+                size = os.fstat(f.fileno()).st_size
+
+                # Hash straight out of the page cache via mmap - no
+                # read() syscalls or user-buffer copies. mmap rejects
+                # empty files, and very large ones stay on the chunked
+                # path to avoid mapping-thrash
+                if 0 < size <= (2 << 30):
+                    try:
+                        with mmap.mmap(f.fileno(), 0,
+                                       access=mmap.ACCESS_READ) as mm:
+                            if hasattr(mm, 'madvise'):
+                                mm.madvise(mmap.MADV_SEQUENTIAL)
+                            hasher.update(mm)
+                        return hasher.hexdigest()
+                    except (OSError, ValueError):
+                        pass  # Fall through to the chunked read
+
+                # 1MB chunks into one reused buffer - no per-chunk
+                # bytes allocation and far fewer read() syscalls
+                buf = bytearray(1 << 20)
+                view = memoryview(buf)
+                while n := f.readinto(buf):
+                    hasher.update(view[:n])
+            return hasher.hexdigest()
         except Exception as e:
             print(f"Error calculating hash: {e}")
             return "unknown"
     
-    def create_output_directory(self, input_path: str) -> Path:
-        """Create structured output directory based on filename and SHA256"""
+    def _copy_and_hash(self, source_path: str, dest_path: str) -> Optional[str]:
+        """
+        Copy a file while hashing the same buffers in one streamed pass
+
+        Returns:
+            Content hash of the copied bytes, or None on failure
+        """
+        try:
+            hasher = blake3.blake3() if blake3 is not None else hashlib.sha256()
+            with open(source_path, 'rb') as fsrc, \
+                 open(dest_path, 'wb') as fdst:
+                buf = bytearray(1 << 20)
+                view = memoryview(buf)
+                while n := fsrc.readinto(buf):
+                    hasher.update(view[:n])
+                    fdst.write(view[:n])
+            shutil.copystat(source_path, dest_path)
+            return hasher.hexdigest()
+        except Exception as e:
+            print(f"Error copying file: {e}")
+            return None
+
+    def create_output_directory(self, input_path: str,
+                                file_hash: Optional[str] = None) -> Path:
+        """Create structured output directory based on filename and hash"""
         input_file = Path(input_path)
         filename = input_file.stem
-        file_hash = self.calculate_file_hash(input_path)
-        
+        if file_hash is None:
+            file_hash = self.calculate_file_hash(input_path)
+
         # Create directory name: filename_sha256 (truncated)
         dir_name = f"{filename}_{file_hash[:16]}"  # Use first 16 chars of hash
         output_dir = self.output_base_dir / dir_name
@@ -168,22 +552,48 @@ class OCROverlayFixed:
     def safe_copy_file(self, source_path: str, dest_path: str) -> bool:
         """Safely copy a file with integrity verification"""
         try:
-            # Use shutil.copy2 to preserve metadata
-            shutil.copy2(source_path, dest_path)
-            
-            # Verify file integrity
-            original_size = os.path.getsize(source_path)
-            copied_size = os.path.getsize(dest_path)
-            
+            # Kernel-space copy - copy_file_range moves the bytes
+            # without round-tripping them through a user-space buffer;
+            # fall back to a buffered copy where it is unsupported
+            # (non-Linux, cross-filesystem)
+            with open(source_path, 'rb') as fsrc, \
+                 open(dest_path, 'wb') as fdst:
+                original_size = os.fstat(fsrc.fileno()).st_size
+                copied = 0
+                use_cfr = hasattr(os, 'copy_file_range')
+                while use_cfr and copied < original_size:
+                    try:
+                        sent = os.copy_file_range(fsrc.fileno(),
+                                                  fdst.fileno(),
+                                                  original_size - copied)
+                    except OSError:
+                        use_cfr = False
+                        break
+                    if sent == 0:
+                        break
+                    copied += sent
+                if copied < original_size:
+                    # Offsets were advanced by copy_file_range, so the
+                    # buffered copy picks up where it stopped
+                    shutil.copyfileobj(fsrc, fdst, 1 << 20)
+
+                # Verify file integrity on the still-open descriptor
+                fdst.flush()
+                copied_size = os.fstat(fdst.fileno()).st_size
+
+            # Preserve metadata as shutil.copy2 would
+            shutil.copystat(source_path, dest_path)
+
             if original_size != copied_size:
                 print(f"Warning: File size mismatch after copy")
                 return False
             
-            # Verify copied file is readable
+            # Verify copied file is readable - verify() checks the file
+            # structure without decoding any pixel data
             if dest_path.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp')):
                 try:
                     with Image.open(dest_path) as img:
-                        pass  # Just verify it opens
+                        img.verify()
                 except Exception as e:
                     print(f"Warning: Copied image file appears corrupted: {e}")
                     return False
@@ -211,8 +621,11 @@ class OCROverlayFixed:
                 if original.mode != 'RGB':
                     original = original.convert('RGB')
                 
-                # Create a copy for overlay
-                overlay_img = original.copy()
+                # Pooled scratch image reset to the original pixels -
+                # reuses one big buffer across calls instead of
+                # allocating a fresh copy per overlay
+                overlay_img = self._acquire_image(original.size)
+                overlay_img.paste(original)
                 
                 # Color schemes (without alpha channel issues)
                 colors = {
@@ -234,60 +647,81 @@ class OCROverlayFixed:
                 }
                 
                 style = colors.get(overlay_style, colors["highlight"])
-                
-                # Create draw object
-                draw = ImageDraw.Draw(overlay_img)
-                
-                # Create overlay for each text block
-                overlays_created = 0
-                for block in text_blocks:
-                    x, y = block['x'], block['y']
-                    width, height = block['width'], block['height']
-                    text = block['text']
-                    
-                    # Skip if coordinates are invalid
-                    if width <= 0 or height <= 0:
-                        continue
-                    
-                    # Calculate text size for centering
-                    try:
-                        text_bbox = draw.textbbox((0, 0), text, font=self.font)
-                        text_width = text_bbox[2] - text_bbox[0]
-                        text_height = text_bbox[3] - text_bbox[1]
-                    except:
-                        # Fallback if textbbox not available
-                        text_width = len(text) * self.font_size * 0.6
-                        text_height = self.font_size
-                    
-                    # Position text in center of detected area
-                    text_x = x + max(0, (width - text_width) // 2)
-                    text_y = y + max(0, (height - text_height) // 2)
-                    
-                    # Ensure text stays within image bounds
-                    text_x = max(0, min(text_x, original.width - text_width))
-                    text_y = max(0, min(text_y, original.height - text_height))
-                    
-                    # Draw background rectangle
-                    bg_rect = [
-                        max(0, text_x - 4),
-                        max(0, text_y - 2),
-                        min(original.width, text_x + text_width + 4),
-                        min(original.height, text_y + text_height + 2)
-                    ]
-                    
-                    # Draw background
-                    draw.rectangle(bg_rect, fill=style["bg"], outline=style["border"], width=1)
-                    
-                    # Draw text
-                    draw.text((text_x, text_y), text, font=self.font, fill=style["text"])
-                    
-                    overlays_created += 1
-                
+
+                # Skip blocks with invalid coordinates up front
+                blocks = [b for b in text_blocks
+                          if b['width'] > 0 and b['height'] > 0]
+                overlays_created = len(blocks)
+
+                if blocks:
+                    n = len(blocks)
+
+                    # Measure text via the per-string cache, then do all
+                    # centering/clamping arithmetic as array operations
+                    tw = np.empty(n, np.int32)
+                    th = np.empty(n, np.int32)
+                    for i, block in enumerate(blocks):
+                        tw[i], th[i] = self._text_size(block['text'])
+
+                    bx = np.fromiter((b['x'] for b in blocks), np.int32, n)
+                    by = np.fromiter((b['y'] for b in blocks), np.int32, n)
+                    bw = np.fromiter((b['width'] for b in blocks), np.int32, n)
+                    bh = np.fromiter((b['height'] for b in blocks), np.int32, n)
+
+                    img_w, img_h = original.width, original.height
+
+                    # Center text in each detected area, clamped to the
+                    # image bounds
+                    tx = bx + np.maximum(0, (bw - tw) // 2)
+                    ty = by + np.maximum(0, (bh - th) // 2)
+                    tx = np.clip(tx, 0, np.maximum(0, img_w - tw))
+                    ty = np.clip(ty, 0, np.maximum(0, img_h - th))
+
+                    # Background rectangles with padding
+                    rx0 = np.clip(tx - 4, 0, img_w)
+                    ry0 = np.clip(ty - 2, 0, img_h)
+                    rx1 = np.clip(tx + tw + 4, 0, img_w)
+                    ry1 = np.clip(ty + th + 2, 0, img_h)
+
+                    # Fill backgrounds and 1px borders as array slice
+                    # assignments - each is a bulk memset, not a Pillow
+                    # polygon rasterization
+                    arr = np.array(overlay_img, dtype=np.uint8)
+                    bg = np.array(style["bg"], dtype=np.uint8)
+                    border = np.array(style["border"], dtype=np.uint8)
+
+                    for x0, y0, x1, y1 in zip(rx0, ry0, rx1, ry1):
+                        if x1 <= x0 or y1 <= y0:
+                            continue
+                        arr[y0:y1, x0:x1] = bg
+                        arr[y0, x0:x1] = border
+                        arr[y1 - 1, x0:x1] = border
+                        arr[y0:y1, x0] = border
+                        arr[y0:y1, x1 - 1] = border
+
+                    # Decode the filled pixels back into the pooled
+                    # image's existing buffer rather than materializing
+                    # a brand-new Image from the array
+                    overlay_img.frombytes(arr.tobytes())
+                    draw = ImageDraw.Draw(overlay_img)
+
+                    # Glyph rendering stays with Pillow
+                    for i, block in enumerate(blocks):
+                        draw.text((int(tx[i]), int(ty[i])), block['text'],
+                                  font=self.font, fill=style["text"])
+
                 print(f"Created {overlays_created} text overlays")
                 
-                # Save result with high quality
-                overlay_img.save(output_path, format='PNG', optimize=False)
-                
+                # Save with fast deflate (level 1) - the zlib pass at
+                # Pillow's default level 6 dominates write time for big
+                # overlays, and the ~20-30% size increase is fine for
+                # an intermediate artifact. Then hand the scratch image
+                # back to the pool
+                overlay_img.save(output_path, format='PNG',
+                                 optimize=False, compress_level=1)
+                self._release_image(overlay_img)
+
+
                 # Verify saved file
                 if os.path.exists(output_path):
                     try:
@@ -307,89 +741,170 @@ class OCROverlayFixed:
             traceback.print_exc()
             return False
     
-    def save_text_file(self, text_blocks: List[Dict], output_path: str) -> bool:
+    def save_text_file(self, text_blocks: List[Dict], output_path: str,
+                       all_text: Optional[str] = None) -> bool:
         """Save extracted text to TXT file"""
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write("OCR Extracted Text\n")
-                f.write("=" * 50 + "\n\n")
-                
-                for i, block in enumerate(text_blocks, 1):
-                    f.write(f"Text Block {i}:\n")
-                    f.write(f"Text: {block['text']}\n")
-                    f.write(f"Position: ({block['x']}, {block['y']})\n")
-                    f.write(f"Size: {block['width']} x {block['height']}\n")
-                    f.write(f"Confidence: {block['confidence']}%\n")
-                    f.write("-" * 30 + "\n")
-                
-                # Also save plain text
-                f.write("\n\nPlain Text:\n")
-                f.write("=" * 20 + "\n")
-                all_text = "\n".join([block['text'] for block in text_blocks])
-                f.write(all_text)
-            
+            # Assemble the whole report and write it in one call - a
+            # single bulk copy instead of ~7 buffered writes per block
+            parts = ["OCR Extracted Text\n", "=" * 50, "\n\n"]
+
+            for i, block in enumerate(text_blocks, 1):
+                parts.append(
+                    f"Text Block {i}:\n"
+                    f"Text: {block['text']}\n"
+                    f"Position: ({block['x']}, {block['y']})\n"
+                    f"Size: {block['width']} x {block['height']}\n"
+                    f"Confidence: {block['confidence']}%\n"
+                    + "-" * 30 + "\n")
+
+            # Also save plain text - already joined during extraction
+            # unless the caller didn't have it handy
+            parts.append("\n\nPlain Text:\n" + "=" * 20 + "\n")
+            if all_text is None:
+                all_text = "\n".join(block['text'] for block in text_blocks)
+            parts.append(all_text)
+
+            with open(output_path, 'w', encoding='utf-8',
+                      buffering=1 << 20) as f:
+                f.write(''.join(parts))
+
             print(f"Text file saved: {output_path}")
             return True
         except Exception as e:
             print(f"Error saving text file: {e}")
             return False
     
-    def save_pdf_file(self, text_blocks: List[Dict], output_path: str, original_image_path: str) -> bool:
-        """Save extracted text and image to PDF file"""
+    def save_pdf_batch(self, results: List[Dict], out_path: str) -> bool:
+        """
+        Save extracted text from a batch of results into one PDF
+
+        A single canvas with showPage() between documents amortizes
+        ReportLab's xref/trailer build and file write across the whole
+        batch instead of paying a full save per image.
+
+        Args:
+            results: Dicts each carrying a 'text_blocks' list
+            out_path: Destination PDF path
+        """
         if not PDF_AVAILABLE:
             print("PDF generation skipped - reportlab not available")
             return False
-            
+
         try:
-            c = canvas.Canvas(output_path, pagesize=letter)
+            c = canvas.Canvas(out_path, pagesize=letter)
             width, height = letter
-            
-            # Add title
-            c.setFont("Helvetica-Bold", 16)
-            c.drawString(50, height - 50, "OCR Extracted Text Report")
-            
-            # Add extracted text
-            c.setFont("Helvetica", 10)
-            y_position = height - 100
-            
-            for i, block in enumerate(text_blocks, 1):
-                if y_position < 100:  # Start new page if needed
-                    c.showPage()
-                    y_position = height - 50
-                
-                c.drawString(50, y_position, f"Block {i}: {block['text']}")
-                y_position -= 15
-                c.drawString(70, y_position, f"Position: ({block['x']}, {block['y']}) - Confidence: {block['confidence']}%")
-                y_position -= 25
-            
+
+            for result in results:
+                text_blocks = result.get('text_blocks', [])
+
+                # Add title
+                c.setFont("Helvetica-Bold", 16)
+                c.drawString(50, height - 50, "OCR Extracted Text Report")
+
+                # Add extracted text
+                c.setFont("Helvetica", 10)
+                y_position = height - 100
+
+                for i, block in enumerate(text_blocks, 1):
+                    if y_position < 100:  # Start new page if needed
+                        c.showPage()
+                        c.setFont("Helvetica", 10)
+                        y_position = height - 50
+
+                    c.drawString(50, y_position, f"Block {i}: {block['text']}")
+                    y_position -= 15
+                    c.drawString(70, y_position, f"Position: ({block['x']}, {block['y']}) - Confidence: {block['confidence']}%")
+                    y_position -= 25
+
+                c.showPage()
+
             c.save()
-            print(f"PDF file saved: {output_path}")
+            print(f"PDF file saved: {out_path}")
             return True
-            
+
         except Exception as e:
             print(f"Error saving PDF file: {e}")
             return False
+
+    def save_pdf_file(self, text_blocks: List[Dict], output_path: str, original_image_path: str) -> bool:
+        """Save extracted text and image to PDF file"""
+        return self.save_pdf_batch([{'text_blocks': text_blocks}],
+                                   output_path)
     
+    def process_images(self, input_paths: List[str],
+                       overlay_style: str = "highlight") -> List[Dict]:
+        """
+        Process a batch of images in parallel
+
+        OCR is the dominant cost and tesserocr drops the GIL during
+        recognition, so a thread per core gives near-linear scaling;
+        each worker lazily creates its own Tesseract API instance via
+        the per-thread property.
+
+        Args:
+            input_paths: Paths of images to process
+            overlay_style: Overlay style applied to every image
+
+        Returns:
+            One result dict per input path, in input order
+        """
+        if len(input_paths) <= 1:
+            return [self.process_image(p, overlay_style)
+                    for p in input_paths]
+
+        max_workers = min(len(input_paths), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda path: self.process_image(path, overlay_style),
+                input_paths))
+
     def process_image(self, input_path: str, overlay_style: str = "highlight") -> Dict:
         """
         Complete OCR processing pipeline with fixed file handling
         """
         print(f"\n Processing image: {input_path}")
         print("=" * 60)
-        
-        # Validate input file
-        if not os.path.exists(input_path):
+
+        # Validate input with one up-front stat - every later step
+        # works on open descriptors (or reuses the copy), so this is
+        # the only path lookup the pipeline pays for the input
+        try:
+            os.stat(input_path)
+        except OSError:
             return {
                 "success": False,
                 "error": f"Input file not found: {input_path}",
                 "text_blocks": []
             }
-        
+
+
+        input_file = Path(input_path)
+
+        # Fused copy+hash: stream the input once into a temp file while
+        # hashing the same buffers - the hash then names the output
+        # directory and the temp copy is renamed into it, so the input
+        # is read once instead of once per consumer
+        file_hash = None
+        tmp_copy = None
+        try:
+            self.output_base_dir.mkdir(parents=True, exist_ok=True)
+            tmp_copy = (self.output_base_dir
+                        / f".copy_{os.getpid()}_{threading.get_ident()}.tmp")
+            file_hash = self._copy_and_hash(input_path, str(tmp_copy))
+            if file_hash is None and tmp_copy.exists():
+                tmp_copy.unlink()
+                tmp_copy = None
+        except Exception:
+            file_hash = None
+            tmp_copy = None
+
         # Create structured output directory
         try:
-            output_dir = self.create_output_directory(input_path)
-            input_file = Path(input_path)
+            output_dir = self.create_output_directory(input_path, file_hash)
         except Exception as e:
+            if tmp_copy is not None and tmp_copy.exists():
+                tmp_copy.unlink()
             return {
                 "success": False,
                 "error": f"Failed to create output directory: {e}",
@@ -403,10 +918,15 @@ class OCROverlayFixed:
         pdf_file_path = output_dir / "document.pdf"
         json_file_path = output_dir / "ocr_data.json"
         
-        # Extract text with positions
-        text_blocks = self.extract_text_with_positions(input_path)
+        # Extract text with positions (cached by content hash, so a
+        # second run over the same bytes skips the recognition pass);
+        # the joined plain text comes back from the same pass
+        text_blocks, all_text = self.extract_text_with_positions(
+            input_path, file_hash=file_hash)
         
         if not text_blocks:
+            if tmp_copy is not None and tmp_copy.exists():
+                tmp_copy.unlink()
             return {
                 "success": False,
                 "error": "No text found in image",
@@ -423,52 +943,77 @@ class OCROverlayFixed:
             "save_json": False
         }
         
-        # 1. Copy original file safely
+        # 1. Move the already-hashed copy into place; fall back to a
+        # fresh copy only if the fused pass failed
         print(f"\n Copying original file...")
-        operations_success["copy_original"] = self.safe_copy_file(input_path, str(original_copy_path))
+        if tmp_copy is not None:
+            try:
+                os.replace(tmp_copy, original_copy_path)
+                operations_success["copy_original"] = True
+            except OSError as e:
+                print(f"Error moving copied file: {e}")
+                operations_success["copy_original"] = self.safe_copy_file(
+                    input_path, str(original_copy_path))
+        else:
+            operations_success["copy_original"] = self.safe_copy_file(
+                input_path, str(original_copy_path))
         if operations_success["copy_original"]:
             print(f" Original file copied to: {original_copy_path}")
         else:
             print(f" Failed to copy original file")
         
-        # 2. Create overlay image
-        print(f"\n Creating overlay image...")
-        operations_success["create_overlay"] = self.create_overlay_image_fixed(
-            input_path, text_blocks, str(overlay_image_path), overlay_style
-        )
+        # 2-5. Overlay render, text file, PDF, and JSON are independent
+        # of one another once the text blocks exist - run them
+        # concurrently so the kernel overlaps the writes instead of
+        # paying each flush's latency in sequence
+        print(f"\n Creating overlay image, text, PDF and JSON outputs...")
+
+        def save_json():
+            payload = {
+                "input_file": str(input_file),
+                "processing_info": {
+                    "overlay_style": overlay_style,
+                    "total_text_blocks": len(text_blocks),
+                    "file_hash": (file_hash if file_hash
+                                  else self.calculate_file_hash(input_path))
+                },
+                "text_blocks": text_blocks
+            }
+            try:
+                if orjson is not None:
+                    # C-speed encode, single bytes write
+                    with open(json_file_path, 'wb') as f:
+                        f.write(orjson.dumps(payload,
+                                             option=orjson.OPT_INDENT_2))
+                else:
+                    with open(json_file_path, 'w', encoding='utf-8') as f:
+                        json.dump(payload, f, indent=2)
+                return True
+            except Exception as e:
+                print(f" Failed to save JSON file: {e}")
+                return False
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            overlay_future = pool.submit(
+                self.create_overlay_image_fixed, input_path, text_blocks,
+                str(overlay_image_path), overlay_style)
+            text_future = pool.submit(self.save_text_file, text_blocks,
+                                      str(text_file_path), all_text)
+            pdf_future = pool.submit(self.save_pdf_file, text_blocks,
+                                     str(pdf_file_path), input_path)
+            json_future = pool.submit(save_json)
+
+        operations_success["create_overlay"] = overlay_future.result()
+        operations_success["save_text"] = text_future.result()
+        operations_success["save_pdf"] = pdf_future.result()
+        operations_success["save_json"] = json_future.result()
+
         if operations_success["create_overlay"]:
             print(f" Overlay image saved to: {overlay_image_path}")
         else:
             print(f" Failed to create overlay image")
-        
-        # 3. Save text file
-        print(f"\n Saving text file...")
-        operations_success["save_text"] = self.save_text_file(text_blocks, str(text_file_path))
-        
-        # 4. Save PDF file
-        print(f"\n Saving PDF file...")
-        operations_success["save_pdf"] = self.save_pdf_file(text_blocks, str(pdf_file_path), input_path)
-        
-        # 5. Save JSON data
-        print(f"\n Saving JSON data...")
-        try:
-            with open(json_file_path, 'w', encoding='utf-8') as f:
-                json.dump({
-                    "input_file": str(input_file),
-                    "processing_info": {
-                        "overlay_style": overlay_style,
-                        "total_text_blocks": len(text_blocks),
-                        "file_hash": self.calculate_file_hash(input_path)
-                    },
-                    "text_blocks": text_blocks
-                }, f, indent=2)
-            operations_success["save_json"] = True
+        if operations_success["save_json"]:
             print(f" JSON data saved to: {json_file_path}")
-        except Exception as e:
-            print(f" Failed to save JSON file: {e}")
-        
-        # Extract all text for summary
-        all_text = "\n".join([block['text'] for block in text_blocks])
         
         # Determine overall success
         critical_operations = ["copy_original", "create_overlay"]
@@ -507,12 +1052,10 @@ def main():
                        help="Base output directory")
     
     args = parser.parse_args()
-    
-    # Validate input
-    if not os.path.exists(args.input_image):
-        print(f"Error: Input image '{args.input_image}' not found")
-        sys.exit(1)
-    
+
+    # Input validation happens inside process_image (single stat);
+    # a missing file surfaces through the failure result below
+
     # Create OCR processor
     ocr_processor = OCROverlayFixed(
         tesseract_cmd=args.tesseract_cmd,
@@ -7,8 +7,18 @@ Handles PDF text extraction with precise coordinate tracking
 import pdfplumber
 import sys
 import os
+import asyncio
+import hashlib
+import logging
+import threading
 from contextlib import redirect_stderr
 from io import StringIO
+from pathlib import Path
+
+# Lazy %-style formatting throughout - a disabled level short-circuits
+# before any message string is built, which matters when a bad-OCR
+# document emits tens of thousands of per-word warnings
+logger = logging.getLogger(__name__)
 
 # Avoid conflicts with other 'fitz' packages
 fitz = None
@@ -16,26 +26,199 @@ try:
     # Try the direct import first
     import fitz as pymupdf_fitz
     fitz = pymupdf_fitz
-    print("PyMuPDF loaded successfully.")
+    logger.info("PyMuPDF loaded successfully.")
 except ImportError:
     try:
         import pymupdf
         fitz = pymupdf
-        print("PyMuPDF loaded via pymupdf module.")
+        logger.info("PyMuPDF loaded via pymupdf module.")
     except ImportError:
-        print("Warning: PyMuPDF not installed. Using pdfplumber only.")
+        logger.warning("PyMuPDF not installed. Using pdfplumber only.")
         # We'll rely on pdfplumber for all operations
-        
+
+# Optional in-process Tesseract API - avoids spawning a process and
+# reloading language data for every OCR'd page
+try:
+    from tesserocr import PyTessBaseAPI, RIL, iterate_level
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
 from typing import List, Dict, Tuple, Optional, Any
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
+
+
+def _otsu_threshold(arr: np.ndarray) -> int:
+    """Compute Otsu's threshold for a uint8 grayscale array"""
+    hist = np.bincount(arr.ravel(), minlength=256).astype(np.float64)
+    total = arr.size
+
+    weights = np.cumsum(hist)
+    means = np.cumsum(hist * np.arange(256))
+
+    w0 = weights[:-1]
+    w1 = total - w0
+    valid = (w0 > 0) & (w1 > 0)
+
+    m0 = means[:-1] / np.where(w0 == 0, 1, w0)
+    m1 = (means[-1] - means[:-1]) / np.where(w1 == 0, 1, w1)
+
+    between = w0 * w1 * (m0 - m1) ** 2
+    between[~valid] = 0
+    return int(np.argmax(between))
+
+
+def _binarize_for_ocr(img):
+    """
+    Binarize a grayscale page image with Otsu's threshold
+
+    Tesseract binarizes internally anyway; doing it up front on a
+    single channel cuts the bytes handed to the engine and skips its
+    multi-channel thresholding.
+    """
+    from PIL import Image
+
+    gray = img if img.mode == "L" else img.convert("L")
+    arr = np.asarray(gray)
+    threshold = _otsu_threshold(arr)
+    return Image.fromarray((arr > threshold).astype(np.uint8) * 255, mode="L")
+
+
+def _ocr_worker_init():
+    """Initializer for OCR worker processes"""
+    # Keep each Tesseract instance single-threaded so parallel workers
+    # don't oversubscribe the machine via OpenMP
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+
+
+def _ocr_page_worker(args):
+    """
+    OCR a single page in a worker process (module-level for pickling)
+
+    Args:
+        args: (pdf_path, page_num, dpi) tuple
+
+    Returns:
+        (page_num, words) where words are (text, x0, y0, x1, y1) tuples
+        in rendered-image coordinates
+    """
+    pdf_path, page_num, dpi = args
+    words = []
+
+    try:
+        import pytesseract
+        from PIL import Image
+
+        doc = fitz.open(pdf_path)
+        page = doc[page_num - 1]
+        pix = page.get_pixmap(dpi=dpi, colorspace=fitz.csGRAY)
+        img = _binarize_for_ocr(
+            Image.frombytes("L", (pix.width, pix.height), pix.samples))
+        doc.close()
+
+        data = pytesseract.image_to_data(img, output_type=pytesseract.Output.DICT)
+        for i in range(len(data['text'])):
+            text = data['text'][i].strip()
+            if not text:
+                continue
+            x0 = float(data['left'][i])
+            y0 = float(data['top'][i])
+            words.append((text, x0, y0,
+                          x0 + float(data['width'][i]),
+                          y0 + float(data['height'][i])))
+
+    except Exception as e:
+        logger.error("OCR error on page %d: %s", page_num, e)
+
+    return page_num, words
+
+def _new_columns() -> Dict[str, list]:
+    """Fresh columnar accumulators for word extraction"""
+    return {key: [] for key in ('text', 'font_name', 'font_size',
+                                'x0', 'y0', 'x1', 'y1', 'page_num')}
+
+
+def _pdfplumber_collect_page(page, page_num: int, cols: Dict[str, list]) -> None:
+    """Append one pdfplumber page's words to the columnar accumulators"""
+    words = page.extract_words(
+        x_tolerance=3,
+        y_tolerance=3,
+        keep_blank_chars=False,
+        use_text_flow=True,
+        extra_attrs=['fontname', 'size']
+    )
+
+    for word in words:
+        # Check if word has required fields
+        # pdfplumber uses 'top' and 'bottom' instead of 'y0' and 'y1'
+        if all(key in word for key in ['text', 'x0', 'x1']):
+            # Whitespace-only words contribute nothing downstream but
+            # still get sorted, normalized and gridded - drop them here
+            t = word['text']
+            if not t or t.isspace():
+                continue
+
+            y0 = word.get('top', word.get('y0'))
+            y1 = word.get('bottom', word.get('y1'))
+
+            if y0 is not None and y1 is not None:
+                if float(word['x1']) <= float(word['x0']) or float(y1) <= float(y0):
+                    continue
+                # Documents repeat a handful of font names thousands
+                # of times - intern so each is one shared string
+                font_name = word.get('fontname')
+                cols['text'].append(word['text'])
+                cols['font_name'].append(sys.intern(font_name)
+                                         if font_name else None)
+                cols['font_size'].append(word.get('size'))
+                cols['x0'].append(float(word['x0']))
+                cols['y0'].append(float(y0))
+                cols['x1'].append(float(word['x1']))
+                cols['y1'].append(float(y1))
+                cols['page_num'].append(page_num)
+            else:
+                logger.warning("Missing y coordinates for word: %r", word['text'])
 
-@dataclass
+
+def _extract_pdfplumber_range(args):
+    """
+    Extract a page range in a worker process (module-level for pickling)
+
+    Each worker opens the PDF itself - pdfplumber handles aren't
+    picklable or fork-safe to share.
+
+    Args:
+        args: (pdf_path, first_page, last_page) with 1-based inclusive
+              bounds
+
+    Returns:
+        (dimensions, columns) for the range
+    """
+    pdf_path, first, last = args
+    dimensions = {}
+    cols = _new_columns()
+
+    try:
+        with redirect_stderr(StringIO()):
+            with pdfplumber.open(pdf_path) as pdf:
+                for page_num in range(first, last + 1):
+                    page = pdf.pages[page_num - 1]
+                    dimensions[page_num] = (page.width, page.height)
+                    _pdfplumber_collect_page(page, page_num, cols)
+    except Exception as e:
+        logger.error("Error with pdfplumber on pages %d-%d: %s", first, last, e)
+
+    return dimensions, cols
+
+
+@dataclass(slots=True)
 class TextElement:
     """Represents a text element with position and properties for feature extraction"""
     text: str
     x0: float  # Left coordinate
-    y0: float  # Top coordinate  
+    y0: float  # Top coordinate
     x1: float  # Right coordinate
     y1: float  # Bottom coordinate
     width: float
@@ -43,22 +226,33 @@ class TextElement:
     page_num: int
     font_size: Optional[float] = None
     font_name: Optional[str] = None
-    
+    # Geometry derived once at construction - feature and grouping code
+    # reads these repeatedly, so recomputing per access wastes work
+    _cx: float = field(init=False, repr=False, default=0.0)
+    _cy: float = field(init=False, repr=False, default=0.0)
+    _area: float = field(init=False, repr=False, default=0.0)
+
+    def __post_init__(self):
+        self._cx = (self.x0 + self.x1) / 2
+        self._cy = (self.y0 + self.y1) / 2
+        self._area = self.width * self.height
+
     @property
     def center_x(self) -> float:
         """X coordinate of text center"""
-        return (self.x0 + self.x1) / 2
-    
+        return self._cx
+
     @property
     def center_y(self) -> float:
         """Y coordinate of text center"""
-        return (self.y0 + self.y1) / 2
-    
+        return self._cy
+
     @property
     def area(self) -> float:
         """Area of text bounding box"""
-        return self.width * self.height
-    
+        return self._area
+
+
     def to_feature_vector(self) -> List[float]:
         """Convert to numerical feature vector for ML"""
         return [
@@ -71,27 +265,204 @@ class TextElement:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary including computed properties"""
-        data = asdict(self)
-        data.update({
-            'center_x': self.center_x,
-            'center_y': self.center_y,
-            'area': self.area
-        })
-        return data
+        return {
+            'text': self.text,
+            'x0': self.x0,
+            'y0': self.y0,
+            'x1': self.x1,
+            'y1': self.y1,
+            'width': self.width,
+            'height': self.height,
+            'page_num': self.page_num,
+            'font_size': self.font_size,
+            'font_name': self.font_name,
+            'center_x': self._cx,
+            'center_y': self._cy,
+            'area': self._area
+        }
+
+
+class ElementTable:
+    """
+    Columnar (structure-of-arrays) view of extracted text elements
+
+    Numeric fields live in parallel NumPy arrays so exporters and
+    feature code can run vectorized operations instead of per-element
+    attribute access. Text and font names stay as Python lists.
+    """
+
+    def __init__(self, elements: List["TextElement"]):
+        n = len(elements)
+        self.text = [elem.text for elem in elements]
+        self.font_name = [elem.font_name for elem in elements]
+        self.x0 = np.fromiter((e.x0 for e in elements), dtype=np.float64, count=n)
+        self.y0 = np.fromiter((e.y0 for e in elements), dtype=np.float64, count=n)
+        self.x1 = np.fromiter((e.x1 for e in elements), dtype=np.float64, count=n)
+        self.y1 = np.fromiter((e.y1 for e in elements), dtype=np.float64, count=n)
+        self.width = np.fromiter((e.width for e in elements), dtype=np.float64, count=n)
+        self.height = np.fromiter((e.height for e in elements), dtype=np.float64, count=n)
+        self.page_num = np.fromiter((e.page_num for e in elements), dtype=np.int32, count=n)
+        # None font sizes become NaN so reductions can use nan-aware ops
+        self.font_size = np.fromiter(
+            (e.font_size if e.font_size is not None else np.nan for e in elements),
+            dtype=np.float64, count=n)
+        # Character counts, computed once - downstream features reuse
+        # the column instead of re-running len() over every string
+        self.text_len = np.fromiter((len(t) for t in self.text),
+                                    dtype=np.int32, count=n)
+
+    @classmethod
+    def from_columns(cls, text: List[str], font_name: List[Optional[str]],
+                     x0, y0, x1, y1, page_num,
+                     font_size: List[Optional[float]]) -> "ElementTable":
+        """
+        Build a table directly from per-column sequences
+
+        Extractors that already accumulate columnar lists can construct
+        the table without ever materializing per-element objects;
+        width/height derive vectorized from the coordinate arrays.
+        """
+        table = cls.__new__(cls)
+        table.text = list(text)
+        table.font_name = list(font_name)
+        table.x0 = np.asarray(x0, dtype=np.float64)
+        table.y0 = np.asarray(y0, dtype=np.float64)
+        table.x1 = np.asarray(x1, dtype=np.float64)
+        table.y1 = np.asarray(y1, dtype=np.float64)
+        table.width = table.x1 - table.x0
+        table.height = table.y1 - table.y0
+        table.page_num = np.asarray(page_num, dtype=np.int32)
+        table.font_size = np.array(
+            [s if s is not None else np.nan for s in font_size],
+            dtype=np.float64)
+        table.text_len = np.fromiter((len(t) for t in table.text),
+                                     dtype=np.int32, count=len(table.text))
+        return table
+
+    def to_elements(self) -> List[TextElement]:
+        """
+        Materialize per-element dataclasses from the columns
+
+        Compatibility view for callers that still work element-wise.
+        """
+        fs = self.font_size
+        return [
+            TextElement(
+                text=self.text[i],
+                x0=float(self.x0[i]),
+                y0=float(self.y0[i]),
+                x1=float(self.x1[i]),
+                y1=float(self.y1[i]),
+                width=float(self.width[i]),
+                height=float(self.height[i]),
+                page_num=int(self.page_num[i]),
+                font_size=None if np.isnan(fs[i]) else float(fs[i]),
+                font_name=self.font_name[i]
+            )
+            for i in range(len(self.text))
+        ]
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    @property
+    def center_x(self) -> np.ndarray:
+        """X coordinates of text centers"""
+        return (self.x0 + self.x1) / 2
+
+    @property
+    def center_y(self) -> np.ndarray:
+        """Y coordinates of text centers"""
+        return (self.y0 + self.y1) / 2
+
+    @property
+    def area(self) -> np.ndarray:
+        """Areas of text bounding boxes"""
+        return self.width * self.height
 
 
 class PDFParser:
     """Extract text and coordinates from PDF for feature vector generation"""
-    
-    def __init__(self, use_ocr: bool = True):
+
+    # Documents at or above this page count are parsed with a process
+    # pool; below it the fork/spawn overhead outweighs the parallelism
+    _PARALLEL_PAGE_MIN = 8
+
+    # Bump to invalidate on-disk extraction caches when the extraction
+    # logic or cached schema changes
+    _CACHE_VERSION = 1
+
+    # In auto mode, fall back to pdfplumber when PyMuPDF extracts
+    # fewer elements than this
+    _AUTO_FALLBACK_MIN = 5
+
+    def __init__(self, use_ocr: bool = True, extract_fonts: bool = True):
         """
         Initialize PDF parser
-        
+
         Args:
             use_ocr: Whether to use OCR for scanned PDFs
+            extract_fonts: Capture font size/name per span. Disabling
+                switches PyMuPDF extraction to the flat "words" mode,
+                which allocates a fraction of the Python objects of the
+                nested "dict" mode - use it when font features aren't
+                needed downstream
         """
         self.use_ocr = use_ocr
-        
+        self.extract_fonts = extract_fonts
+        # Page dimensions captured during the last extraction pass, so
+        # callers don't need to re-open the PDF just for sizes
+        self.last_page_dims: Optional[Dict[int, Tuple[float, float]]] = None
+        # Columnar view of the last extraction - vectorized consumers
+        # work on these arrays instead of per-element attributes
+        self.last_table: Optional[ElementTable] = None
+        # Open PyMuPDF documents keyed by path, so repeated calls for
+        # the same file don't re-parse it
+        self._doc_cache: Dict[str, Any] = {}
+        # One API per thread so concurrent page OCR doesn't share state
+        self._tess_local = threading.local()
+        self._tess_apis = []
+        self._tess_lock = threading.Lock()
+
+    def _get_tess_api(self):
+        """Get (or lazily create) the persistent tesserocr API for this thread"""
+        api = getattr(self._tess_local, "api", None)
+        if api is None:
+            api = PyTessBaseAPI(lang="eng")
+            self._tess_local.api = api
+            with self._tess_lock:
+                self._tess_apis.append(api)
+        return api
+
+    def _open_document(self, pdf_path: str):
+        """Open a PyMuPDF document, reusing a cached handle per path"""
+        doc = self._doc_cache.get(pdf_path)
+        if doc is None:
+            doc = fitz.open(pdf_path)
+            self._doc_cache[pdf_path] = doc
+        return doc
+
+    def close(self):
+        """Release cached documents and any persistent OCR APIs"""
+        for doc in self._doc_cache.values():
+            try:
+                doc.close()
+            except Exception:
+                pass
+        self._doc_cache = {}
+
+        with self._tess_lock:
+            for api in self._tess_apis:
+                api.End()
+            self._tess_apis = []
+        self._tess_local = threading.local()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def extract_with_pdfplumber(self, pdf_path: str) -> List[TextElement]:
         """
         Extract text using pdfplumber (better for structured PDFs)
@@ -102,52 +473,76 @@ class PDFParser:
         Returns:
             List of TextElement objects
         """
-        elements = []
-        
+        dimensions = {}
+
+        # Columnar accumulators - the hot loop only appends scalars to
+        # flat lists; arrays and (compat) elements materialize once at
+        # the end instead of one dataclass per word inside the loop
+        cols = _new_columns()
+
         try:
             # Suppress stderr to hide corruption warnings
+            parallel = False
             with redirect_stderr(StringIO()):
                 with pdfplumber.open(pdf_path) as pdf:
-                    for page_num, page in enumerate(pdf.pages, 1):
-                        # Extract words with bounding boxes
-                        words = page.extract_words(
-                            x_tolerance=3,
-                            y_tolerance=3,
-                            keep_blank_chars=False,
-                            use_text_flow=True,
-                            extra_attrs=['fontname', 'size']
-                        )
-                    
-                        for word in words:
-                            # Check if word has required fields
-                            # pdfplumber uses 'top' and 'bottom' instead of 'y0' and 'y1'
-                            if all(key in word for key in ['text', 'x0', 'x1']):
-                                # Get y coordinates - pdfplumber uses 'top' and 'bottom'
-                                y0 = word.get('top', word.get('y0'))
-                                y1 = word.get('bottom', word.get('y1'))
-                                
-                                if y0 is not None and y1 is not None:
-                                    element = TextElement(
-                                        text=word['text'],
-                                        x0=float(word['x0']),
-                                        y0=float(y0),
-                                        x1=float(word['x1']),
-                                        y1=float(y1),
-                                        width=float(word['x1'] - word['x0']),
-                                        height=float(y1 - y0),
-                                        page_num=page_num,
-                                        font_size=word.get('size'),
-                                        font_name=word.get('fontname')
-                                    )
-                                    elements.append(element)
-                                else:
-                                    print(f"Warning: Missing y coordinates for word: {word['text']}")
-                        
+                    page_count = len(pdf.pages)
+                    workers = min(os.cpu_count() or 1, page_count)
+                    # pdfplumber parsing is CPU-bound pure Python, so
+                    # big documents fan page ranges out to processes
+                    parallel = (page_count >= self._PARALLEL_PAGE_MIN
+                                and workers > 1)
+                    if not parallel:
+                        for page_num, page in enumerate(pdf.pages, 1):
+                            dimensions[page_num] = (page.width, page.height)
+                            _pdfplumber_collect_page(page, page_num, cols)
+
+            if parallel:
+                dimensions, cols = self._extract_pdfplumber_parallel(
+                    pdf_path, page_count, workers)
+
         except Exception as e:
-            print(f"Error with pdfplumber: {str(e)}")
+            logger.error("Error with pdfplumber: %s", e)
             # Don't print traceback for common PDF issues
-            
-        return elements
+
+        if dimensions:
+            self.last_page_dims = dimensions
+
+        self.last_table = ElementTable.from_columns(
+            cols['text'], cols['font_name'], cols['x0'], cols['y0'],
+            cols['x1'], cols['y1'], cols['page_num'], cols['font_size'])
+        return self.last_table.to_elements()
+
+    def _extract_pdfplumber_parallel(self, pdf_path: str, page_count: int,
+                                     workers: int):
+        """
+        Fan pdfplumber page ranges out to worker processes
+
+        Pages are chunked evenly across workers; each worker returns
+        its columnar accumulators and the parent merges them in page
+        order, so the result matches the serial path exactly.
+
+        Args:
+            pdf_path: Path to PDF file
+            page_count: Total number of pages
+            workers: Number of worker processes
+
+        Returns:
+            (dimensions, merged columns)
+        """
+        chunk = -(-page_count // workers)  # Ceiling division
+        ranges = [(pdf_path, start, min(start + chunk - 1, page_count))
+                  for start in range(1, page_count + 1, chunk)]
+
+        dimensions = {}
+        cols = _new_columns()
+        with ProcessPoolExecutor(max_workers=len(ranges)) as ex:
+            for range_dims, range_cols in ex.map(_extract_pdfplumber_range,
+                                                 ranges):
+                dimensions.update(range_dims)
+                for key, values in range_cols.items():
+                    cols[key].extend(values)
+
+        return dimensions, cols
     
     def extract_with_pymupdf(self, pdf_path: str) -> List[TextElement]:
         """
@@ -162,52 +557,93 @@ class PDFParser:
         elements = []
         
         if fitz is None:
-            print("PyMuPDF not available. Skipping PyMuPDF extraction.")
+            logger.warning("PyMuPDF not available. Skipping PyMuPDF extraction.")
             return elements
         
         try:
-            pdf = fitz.open(pdf_path)
-            
+            pdf = self._open_document(pdf_path)
+
             if pdf.page_count == 0:
-                print(f"PyMuPDF: PDF has 0 pages - file may be corrupted")
-                pdf.close()
+                logger.warning("PyMuPDF: PDF has 0 pages - file may be corrupted")
                 return elements
             
-            print(f"PyMuPDF: Processing {pdf.page_count} pages")
+            logger.info("PyMuPDF: Processing %d pages", pdf.page_count)
             
+            ocr_pages = []
+            dimensions = {}
+
             for page_num, page in enumerate(pdf, 1):
-                # Get text blocks with position info
-                blocks = page.get_text("dict")
-                
-                for block in blocks["blocks"]:
-                    if "lines" in block:  # Text block
-                        for line in block["lines"]:
-                            for span in line["spans"]:
-                                bbox = span["bbox"]
-                                element = TextElement(
-                                    text=span["text"],
-                                    x0=float(bbox[0]),
-                                    y0=float(bbox[1]),
-                                    x1=float(bbox[2]),
-                                    y1=float(bbox[3]),
-                                    width=float(bbox[2] - bbox[0]),
-                                    height=float(bbox[3] - bbox[1]),
-                                    page_num=page_num,
-                                    font_size=float(span["size"]),
-                                    font_name=span["font"]
-                                )
-                                elements.append(element)
-                
-                # If no text found and OCR is enabled, try OCR
-                if not elements and self.use_ocr:
-                    print(f"No text found on page {page_num}, attempting OCR...")
-                    elements.extend(self._ocr_page(page, page_num))
-                    
-            pdf.close()
-            
+                before = len(elements)
+                rect = page.rect
+                dimensions[page_num] = (rect.width, rect.height)
+
+                if self.extract_fonts:
+                    # Get text blocks with position info ("dict" is the
+                    # only mode that carries per-span font data)
+                    blocks = page.get_text("dict")
+
+                    for block in blocks["blocks"]:
+                        if "lines" in block:  # Text block
+                            for line in block["lines"]:
+                                for span in line["spans"]:
+                                    # "dict" mode emits plenty of
+                                    # whitespace-only (often "\n"/"\t")
+                                    # and degenerate spans - filter at
+                                    # the source so they never enter
+                                    # the working set
+                                    text = span["text"]
+                                    if not text or text.isspace():
+                                        continue
+                                    bbox = span["bbox"]
+                                    if bbox[2] <= bbox[0] or bbox[3] <= bbox[1]:
+                                        continue
+                                    element = TextElement(
+                                        text=text,
+                                        x0=float(bbox[0]),
+                                        y0=float(bbox[1]),
+                                        x1=float(bbox[2]),
+                                        y1=float(bbox[3]),
+                                        width=float(bbox[2] - bbox[0]),
+                                        height=float(bbox[3] - bbox[1]),
+                                        page_num=page_num,
+                                        font_size=float(span["size"]),
+                                        # Interned - spans repeat few fonts
+                                        font_name=sys.intern(span["font"])
+                                    )
+                                    elements.append(element)
+                else:
+                    # Flat word tuples - far fewer Python objects than
+                    # the nested blocks/lines/spans structure
+                    for x0, y0, x1, y1, text, *_ in page.get_text("words"):
+                        if not text or text.isspace() or x1 <= x0 or y1 <= y0:
+                            continue
+                        elements.append(TextElement(
+                            text=text,
+                            x0=float(x0),
+                            y0=float(y0),
+                            x1=float(x1),
+                            y1=float(y1),
+                            width=float(x1 - x0),
+                            height=float(y1 - y0),
+                            page_num=page_num,
+                            font_size=None,
+                            font_name=None
+                        ))
+
+                # Remember pages with no extractable text for an OCR pass
+                if len(elements) == before and self.use_ocr:
+                    ocr_pages.append(page_num)
+
+            if ocr_pages:
+                logger.info("No text found on pages %s, attempting OCR...", ocr_pages)
+                elements.extend(self._ocr_pages_concurrent(pdf, ocr_pages))
+
+            if dimensions:
+                self.last_page_dims = dimensions
+
         except Exception as e:
-            print(f"Error with PyMuPDF: {str(e)}")
-            
+            logger.error("Error with PyMuPDF: %s", e)
+
         return elements
     
     def _ocr_page(self, page, page_num: int) -> List[TextElement]:
@@ -222,12 +658,13 @@ class PDFParser:
             List of TextElement objects from OCR
         """
         elements = []
-        
+
+        if TESSEROCR_AVAILABLE:
+            return self._ocr_page_tesserocr(page, page_num)
+
         try:
-            # Get page as image
-            pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))  # 2x scale for better OCR
-            
-            # Perform OCR
+            # Perform OCR (get_textpage_ocr renders the page itself; a
+            # separate get_pixmap here would rasterize it a second time)
             text_page = page.get_textpage_ocr(flags=0, language="eng")
             text_dict = text_page.extractDICT()
             
@@ -251,37 +688,371 @@ class PDFParser:
                             elements.append(element)
                             
         except Exception as e:
-            print(f"OCR error on page {page_num}: {str(e)}")
-            
+            logger.error("OCR error on page %d: %s", page_num, e)
+
         return elements
-    
-    def extract_text_with_coordinates(self, pdf_path: str, method: str = "auto") -> List[TextElement]:
+
+    def _ocr_page_tesserocr(self, page, page_num: int) -> List[TextElement]:
+        """
+        Perform OCR on a page via the persistent tesserocr API
+
+        Language data is loaded once per parser instead of once per page,
+        and no subprocess is spawned.
+
+        Args:
+            page: PyMuPDF page object
+            page_num: Page number
+
+        Returns:
+            List of TextElement objects from OCR
+        """
+        try:
+            img, scale = self._render_page_image(page, dpi=self._page_ocr_dpi(page))
+        except Exception as e:
+            logger.error("OCR error on page %d: %s", page_num, e)
+            return []
+
+        return self._ocr_image(img, page_num, scale)
+
+    def _page_ocr_dpi(self, page, target_px: float = 35.0,
+                      min_dpi: int = 150, max_dpi: int = 400,
+                      default_dpi: int = 300) -> int:
+        """
+        Pick a render DPI for OCR based on the page's glyph sizes
+
+        OCR time scales roughly with pixel count, so pages whose text
+        is already large are rendered at a lower DPI targeting ~30-40px
+        glyph height. Pages with no text metrics (typical scans) fall
+        back to the default.
+
+        Args:
+            page: PyMuPDF page object
+            target_px: Desired rendered glyph height in pixels
+            min_dpi: Lower DPI clamp
+            max_dpi: Upper DPI clamp
+            default_dpi: Used when no glyph metrics are available
+
+        Returns:
+            Render DPI for this page
+        """
+        try:
+            heights = [span["bbox"][3] - span["bbox"][1]
+                       for block in page.get_text("dict")["blocks"]
+                       if "lines" in block
+                       for line in block["lines"]
+                       for span in line["spans"]]
+            if not heights:
+                return default_dpi
+
+            median_pt = float(np.median(heights))
+            if median_pt <= 0:
+                return default_dpi
+
+            dpi = int(round(target_px / (median_pt / 72.0)))
+            return max(min_dpi, min(dpi, max_dpi))
+
+        except Exception:
+            return default_dpi
+
+    def _render_page_image(self, page, dpi: int = 300):
+        """
+        Render a page to a PIL image for OCR
+
+        Rendering happens in-process via MuPDF's rasterizer - no
+        external converter subprocess or temp-file round-trip.
+
+        Args:
+            page: PyMuPDF page object
+            dpi: Render resolution
+
+        Returns:
+            (PIL Image, scale) where scale maps image pixels back to
+            page coordinates. The image is grayscale and binarized,
+            which is all Tesseract needs and a third of the RGB bytes.
+        """
+        from PIL import Image
+
+        pix = page.get_pixmap(dpi=dpi, colorspace=fitz.csGRAY)
+        img = Image.frombytes("L", (pix.width, pix.height), pix.samples)
+        return _binarize_for_ocr(img), dpi / 72.0
+
+    def _ocr_image(self, img, page_num: int, scale: float) -> List[TextElement]:
+        """
+        Run OCR on a rendered page image via the persistent tesserocr API
+
+        Safe to call from multiple threads - each thread gets its own API.
+
+        Args:
+            img: PIL image of the rendered page
+            page_num: Page number
+            scale: Scale the image was rendered at (boxes are mapped back)
+
+        Returns:
+            List of TextElement objects from OCR
+        """
+        elements = []
+
+        try:
+            api = self._get_tess_api()
+            api.SetImage(img)
+            api.Recognize()
+
+            iterator = api.GetIterator()
+            for word in iterate_level(iterator, RIL.WORD):
+                text = word.GetUTF8Text(RIL.WORD)
+                if not text or not text.strip():
+                    continue
+
+                x0, y0, x1, y1 = word.BoundingBox(RIL.WORD)
+                element = TextElement(
+                    text=text.strip(),
+                    x0=x0 / scale,
+                    y0=y0 / scale,
+                    x1=x1 / scale,
+                    y1=y1 / scale,
+                    width=(x1 - x0) / scale,
+                    height=(y1 - y0) / scale,
+                    page_num=page_num,
+                    font_size=None,  # OCR doesn't provide font info
+                    font_name=None
+                )
+                elements.append(element)
+
+        except Exception as e:
+            logger.error("OCR error on page %d: %s", page_num, e)
+
+        return elements
+
+    def _ocr_pages_concurrent(self, pdf, page_nums: List[int]) -> List[TextElement]:
+        """
+        OCR several pages concurrently with a bounded fanout
+
+        Pages are rendered serially (MuPDF documents are not thread-safe)
+        and the OCR itself runs concurrently, bounded by the
+        OCR_CONCURRENCY environment variable (default: CPU count).
+
+        Args:
+            pdf: Open PyMuPDF document
+            page_nums: 1-based page numbers to OCR
+
+        Returns:
+            List of TextElement objects from all pages, in page order
+        """
+        if not TESSEROCR_AVAILABLE or len(page_nums) <= 1:
+            # Without the in-process API, parallelize across processes
+            # instead (each worker spawns its own Tesseract)
+            if len(page_nums) > 1:
+                elements = self._ocr_pages_processpool(pdf.name, page_nums)
+                if elements is not None:
+                    return elements
+
+            elements = []
+            for page_num in page_nums:
+                elements.extend(self._ocr_page(pdf[page_num - 1], page_num))
+            return elements
+
+        images = []
+        for page_num in page_nums:
+            page = pdf[page_num - 1]
+            img, scale = self._render_page_image(page, dpi=self._page_ocr_dpi(page))
+            images.append((img, page_num, scale))
+
+        limit = max(1, int(os.environ.get("OCR_CONCURRENCY", os.cpu_count() or 1)))
+
+        async def ocr_all():
+            sem = asyncio.Semaphore(limit)
+
+            async def ocr_one(img, page_num, scale):
+                async with sem:
+                    return await asyncio.to_thread(self._ocr_image, img, page_num, scale)
+
+            return await asyncio.gather(*[ocr_one(*item) for item in images])
+
+        elements = []
+        for page_elements in asyncio.run(ocr_all()):
+            elements.extend(page_elements)
+        return elements
+
+    def _ocr_pages_processpool(self, pdf_path: str,
+                               page_nums: List[int],
+                               dpi: int = 300) -> Optional[List[TextElement]]:
+        """
+        OCR pages in parallel worker processes via pytesseract
+
+        Each worker opens the PDF itself (document handles aren't
+        picklable) and runs a single-threaded Tesseract instance.
+
+        Args:
+            pdf_path: Path to PDF file
+            page_nums: 1-based page numbers to OCR
+            dpi: Render resolution for page rasterization
+
+        Returns:
+            List of TextElement objects, or None if pytesseract is
+            unavailable (caller falls back to sequential OCR)
+        """
+        try:
+            import pytesseract  # noqa: F401
+        except ImportError:
+            return None
+
+        elements = []
+
+        try:
+            scale = dpi / 72.0
+            work = [(pdf_path, n, dpi) for n in page_nums]
+            with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                     initializer=_ocr_worker_init) as ex:
+                for page_num, words in ex.map(_ocr_page_worker, work):
+                    for text, x0, y0, x1, y1 in words:
+                        elements.append(TextElement(
+                            text=text,
+                            x0=x0 / scale,
+                            y0=y0 / scale,
+                            x1=x1 / scale,
+                            y1=y1 / scale,
+                            width=(x1 - x0) / scale,
+                            height=(y1 - y0) / scale,
+                            page_num=page_num,
+                            font_size=None,
+                            font_name=None
+                        ))
+        except Exception as e:
+            logger.error("Parallel OCR failed: %s", e)
+            return None
+
+        return elements
+
+    def _extraction_cache_path(self, pdf_path: str, method: str) -> Path:
+        """
+        Cache file path keyed on content hash, method and version
+
+        Hashing the first 1MB plus the file size is enough to
+        distinguish documents without reading huge PDFs end to end.
+        """
+        hasher = hashlib.md5()
+        with open(pdf_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            hasher.update(f.read(1 << 20))
+        hasher.update(
+            f"{size}:{method}:ocr={self.use_ocr}:fonts={self.extract_fonts}"
+            f":v{self._CACHE_VERSION}".encode())
+
+        cache_dir = Path(os.path.expanduser("~/.cache/navina_text_extractor"))
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return cache_dir / f"{hasher.hexdigest()}_{method}.npz"
+
+    def _load_cached_extraction(self, cache_path: Path):
+        """Rebuild (table, dimensions) from a cache file, None on miss"""
+        try:
+            if not cache_path.exists():
+                return None
+            with np.load(cache_path, allow_pickle=True) as data:
+                table = ElementTable.from_columns(
+                    list(data['text']), list(data['font_name']),
+                    data['x0'], data['y0'], data['x1'], data['y1'],
+                    data['page_num'], data['font_size'])
+                dimensions = {
+                    int(p): (float(w), float(h))
+                    for p, w, h in zip(data['dims_page'], data['dims_w'],
+                                       data['dims_h'])
+                }
+            return table, dimensions
+        except Exception as e:
+            logger.warning("Ignoring unreadable extraction cache: %s", e)
+            return None
+
+    def _store_cached_extraction(self, cache_path: Path, table: ElementTable,
+                                 dimensions: Optional[Dict[int, Tuple[float, float]]]) -> None:
+        """Persist the columnar extraction for reuse on identical input"""
+        try:
+            dimensions = dimensions or {}
+            pages = sorted(dimensions)
+            np.savez_compressed(
+                cache_path,
+                text=np.array(table.text, dtype=object),
+                font_name=np.array(table.font_name, dtype=object),
+                x0=table.x0, y0=table.y0, x1=table.x1, y1=table.y1,
+                page_num=table.page_num, font_size=table.font_size,
+                dims_page=np.array(pages, dtype=np.int32),
+                dims_w=np.array([dimensions[p][0] for p in pages]),
+                dims_h=np.array([dimensions[p][1] for p in pages]))
+        except Exception as e:
+            logger.warning("Failed to write extraction cache: %s", e)
+
+    def extract_text_with_coordinates(self, pdf_path: str, method: str = "auto",
+                                      force_refresh: bool = False) -> List[TextElement]:
         """
         Extract text with coordinates from PDF
-        
+
+        Results are cached on disk keyed by document content hash, so
+        re-running over an unchanged file skips the parse entirely.
+
         Args:
             pdf_path: Path to PDF file
             method: Extraction method - "pdfplumber", "pymupdf", or "auto"
-            
+            force_refresh: Re-extract even when a cached result exists
+
         Returns:
             List of TextElement objects
         """
+        try:
+            cache_path = self._extraction_cache_path(pdf_path, method)
+        except Exception:
+            cache_path = None
+
+        if cache_path is not None and not force_refresh:
+            cached = self._load_cached_extraction(cache_path)
+            if cached is not None:
+                table, dimensions = cached
+                logger.info("Extraction cache hit: %d elements", len(table))
+                self.last_table = table
+                if dimensions:
+                    self.last_page_dims = dimensions
+                return table.to_elements()
+
+        # Drop any table left over from a previous document on this
+        # parser - only the pdfplumber path rebuilds it, so a stale one
+        # could otherwise pass the length check below and send another
+        # file's elements into this document's cache
+        self.last_table = None
+
         if method == "auto":
-            # Try pdfplumber first for structured PDFs
-            elements = self.extract_with_pdfplumber(pdf_path)
-            
-            # If no text found, try PyMuPDF with OCR
-            if not elements:
-                print("No text found with pdfplumber, trying PyMuPDF...")
+            # PyMuPDF first: its C engine parses far faster and leaner
+            # than pdfplumber's pure-Python pdfminer stack, so it wins
+            # for the common case; pdfplumber remains the fallback for
+            # the minority of documents where PyMuPDF finds little
+            # (layout-heavy/structured PDFs)
+            elements = []
+            if fitz is not None:
                 elements = self.extract_with_pymupdf(pdf_path)
-                
+
+            if len(elements) < self._AUTO_FALLBACK_MIN:
+                logger.info("Few or no elements with PyMuPDF, trying pdfplumber...")
+                fallback = self.extract_with_pdfplumber(pdf_path)
+                if len(fallback) > len(elements):
+                    elements = fallback
+                else:
+                    # Keep the PyMuPDF result; drop pdfplumber's table
+                    # so it can't be mistaken for the returned elements
+                    self.last_table = None
+
         elif method == "pdfplumber":
             elements = self.extract_with_pdfplumber(pdf_path)
         elif method == "pymupdf":
             elements = self.extract_with_pymupdf(pdf_path)
         else:
             raise ValueError(f"Unknown method: {method}")
-            
+
+        if cache_path is not None and elements:
+            # Reuse the extractor's columnar table when it matches;
+            # paths that only produced elements rebuild it once here
+            table = self.last_table
+            if table is None or len(table) != len(elements):
+                table = ElementTable(elements)
+            self._store_cached_extraction(cache_path, table,
+                                          self.last_page_dims)
+
         return elements
     
     def get_page_dimensions(self, pdf_path: str) -> Dict[int, Tuple[float, float]]:
@@ -299,14 +1070,13 @@ class PDFParser:
         # Try PyMuPDF first
         if fitz is not None:
             try:
-                pdf = fitz.open(pdf_path)
+                pdf = self._open_document(pdf_path)
                 for page_num, page in enumerate(pdf, 1):
                     rect = page.rect
                     dimensions[page_num] = (rect.width, rect.height)
-                pdf.close()
                 return dimensions
             except Exception as e:
-                print(f"PyMuPDF error getting page dimensions: {str(e)}")
+                logger.error("PyMuPDF error getting page dimensions: %s", e)
         
         # Fallback to pdfplumber
         try:
@@ -314,7 +1084,7 @@ class PDFParser:
                 for page_num, page in enumerate(pdf.pages, 1):
                     dimensions[page_num] = (page.width, page.height)
         except Exception as e:
-            print(f"Error getting page dimensions: {str(e)}")
+            logger.error("Error getting page dimensions: %s", e)
             
         return dimensions
     
@@ -330,27 +1100,46 @@ class PDFParser:
         Returns:
             List of TextElement objects with normalized coordinates
         """
-        normalized = []
-        
-        for elem in elements:
-            if elem.page_num in page_dimensions:
-                width, height = page_dimensions[elem.page_num]
-                
-                # Create normalized copy
-                norm_elem = TextElement(
-                    text=elem.text,
-                    x0=elem.x0 / width,
-                    y0=elem.y0 / height,
-                    x1=elem.x1 / width,
-                    y1=elem.y1 / height,
-                    width=elem.width / width,
-                    height=elem.height / height,
-                    page_num=elem.page_num,
-                    font_size=elem.font_size,
-                    font_name=elem.font_name
-                )
-                normalized.append(norm_elem)
-            else:
-                normalized.append(elem)
-                
-        return normalized
\ No newline at end of file
+        if not elements:
+            return []
+
+        # Gather coordinates into one array and divide in a single
+        # vectorized pass instead of per-element Python arithmetic
+        coords = np.array([(e.x0, e.y0, e.x1, e.y1, e.width, e.height)
+                           for e in elements], dtype=np.float64)
+        pages = np.array([e.page_num for e in elements])
+
+        # Per-element page width/height via one sorted lookup instead
+        # of a mask pass per page; pages without known dimensions
+        # divide by 1 so their coordinates pass through unchanged
+        wh = np.ones((len(elements), 2), dtype=np.float64)
+        if page_dimensions:
+            known_pages = np.array(sorted(page_dimensions), dtype=pages.dtype)
+            widths = np.array([page_dimensions[p][0] for p in known_pages],
+                              dtype=np.float64)
+            heights = np.array([page_dimensions[p][1] for p in known_pages],
+                               dtype=np.float64)
+
+            idx = np.clip(np.searchsorted(known_pages, pages), 0,
+                          len(known_pages) - 1)
+            found = known_pages[idx] == pages
+            wh[found, 0] = widths[idx[found]]
+            wh[found, 1] = heights[idx[found]]
+
+        coords /= wh[:, [0, 1, 0, 1, 0, 1]]
+
+        return [
+            TextElement(
+                text=elem.text,
+                x0=float(row[0]),
+                y0=float(row[1]),
+                x1=float(row[2]),
+                y1=float(row[3]),
+                width=float(row[4]),
+                height=float(row[5]),
+                page_num=elem.page_num,
+                font_size=elem.font_size,
+                font_name=elem.font_name
+            )
+            for elem, row in zip(elements, coords)
+        ]
\ No newline at end of file